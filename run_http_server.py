@@ -5,9 +5,101 @@ This script provides an easy way to run the server with HTTP/SSE transport
 """
 
 import sys
+import json
 import argparse
+
+import uvicorn
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+
 from text_classifier_server import initialize_server, mcp, logger
 
+class JSONRPCBatchMiddleware:
+    """
+    ASGI middleware that accepts JSON-RPC batch arrays on the SSE messages endpoint.
+    
+    Each message in the batch is forwarded to the wrapped app as its own POST, in
+    order, so a client can send several calls in one HTTP round trip. Replies are
+    delivered on the SSE stream exactly as for individual messages.
+    """
+    
+    def __init__(self, app, path: str = "/messages"):
+        self.app = app
+        self.path = path.rstrip("/")
+    
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"].rstrip("/") != self.path
+        ):
+            await self.app(scope, receive, send)
+            return
+        
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+        
+        try:
+            messages = json.loads(body) if body.lstrip().startswith(b"[") else None
+        except ValueError:
+            messages = None
+        
+        # Anything that is not a batch goes to the wrapped app unchanged
+        if messages is None:
+            await self.app(scope, self._replay(body, receive), send)
+            return
+        
+        if not messages:
+            await Response("Empty JSON-RPC batch", status_code=400)(scope, receive, send)
+            return
+        
+        for message in messages:
+            status, response_body = await self._forward(scope, receive, json.dumps(message).encode())
+            if status >= 400:
+                await Response(response_body, status_code=status)(scope, receive, send)
+                return
+        
+        await Response("Accepted", status_code=202)(scope, receive, send)
+    
+    @staticmethod
+    def _replay(body: bytes, receive):
+        """Receive callable that yields an already-read request body once"""
+        sent = False
+        
+        async def replay():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+        
+        return replay
+    
+    async def _forward(self, scope, receive, body: bytes):
+        """POST a single message to the wrapped app and capture its response"""
+        headers = [(name, value) for name, value in scope["headers"] if name != b"content-length"]
+        headers.append((b"content-length", str(len(body)).encode()))
+        
+        status = 500
+        chunks = []
+        
+        async def capture(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+        
+        await self.app({**scope, "headers": headers}, self._replay(body, receive), capture)
+        return status, b"".join(chunks)
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Run Text Classification MCP Server')
     parser.add_argument('--transport', choices=['stdio', 'http', 'sse'], 
@@ -42,8 +134,26 @@ def main():
             logger.info(f"HTTP endpoint: http://{args.host}:{args.port}/mcp")
         logger.info("Use Ctrl+C to stop the server")
         
-        # Run with the specified transport
-        mcp.run(transport=args.transport, host=args.host, port=args.port)
+        # Build the ASGI app ourselves so responses can be compressed.
+        # GZipMiddleware skips text/event-stream, so it only covers non-SSE
+        # responses: streamable HTTP is asked to answer with plain JSON rather
+        # than a one-event stream, while SSE transport replies travel over the
+        # event stream uncompressed.
+        middleware = [Middleware(GZipMiddleware, minimum_size=512)]
+        if args.transport == "sse":
+            middleware.append(Middleware(JSONRPCBatchMiddleware, path="/messages"))
+        
+        app = mcp.http_app(
+            transport="sse" if args.transport == "sse" else "streamable-http",
+            middleware=middleware,
+            json_response=True
+        )
+        uvicorn.run(
+            app,
+            host=args.host,
+            port=args.port,
+            log_level="debug" if args.debug else "info"
+        )
 
 if __name__ == "__main__":
     try:
@@ -4,9 +4,10 @@ Test client for HTTP Text Classification MCP Server
 """
 
 import asyncio
+import itertools
 import json
 import aiohttp
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 class MCPHTTPClient:
     def __init__(self, base_url: str):
@@ -14,122 +15,210 @@ class MCPHTTPClient:
         self.sse_url = f"{self.base_url}/sse"
         self.messages_url = f"{self.base_url}/messages"
         self.session_id = None
+        # Shared for the client's lifetime so connections are pooled across calls
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._request_ids = itertools.count(1)
+        # Tool calls queued with await_batch=True, flushed as one JSON-RPC batch
+        self._pending: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        # Running flush tasks, referenced so they are not garbage collected
+        self._flush_tasks: Set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        # No overall or read timeout so long-lived SSE streams are not cut off
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=None)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self._session.close()
+        self._session = None
 
     async def initialize(self):
         """Initialize connection with the MCP server"""
-        async with aiohttp.ClientSession() as session:
-            # First, connect to SSE endpoint
-            async with session.get(self.sse_url) as response:
-                if response.status == 200:
-                    print(f"✅ Successfully connected to SSE endpoint")
+        session = self._session
+        # First, connect to SSE endpoint
+        async with session.get(self.sse_url) as response:
+            if response.status == 200:
+                print(f"✅ Successfully connected to SSE endpoint")
                     
-                    # Send initialization request
-                    init_request = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "initialize",
-                        "params": {
-                            "protocolVersion": "2024-11-05",
-                            "capabilities": {
-                                "tools": {},
-                                "resources": {}
-                            },
-                            "clientInfo": {
-                                "name": "test-client",
-                                "version": "1.0.0"
-                            }
+                # Send initialization request
+                init_request = {
+                    "jsonrpc": "2.0",
+                    "id": next(self._request_ids),
+                    "method": "initialize",
+                    "params": {
+                        "protocolVersion": "2024-11-05",
+                        "capabilities": {
+                            "tools": {},
+                            "resources": {}
+                        },
+                        "clientInfo": {
+                            "name": "test-client",
+                            "version": "1.0.0"
                         }
                     }
+                }
                     
-                    async with session.post(self.messages_url, json=init_request) as init_response:
-                        if init_response.status == 200:
-                            result = await init_response.json()
-                            print(f"✅ Initialization successful: {result}")
-                            return True
-                        else:
-                            print(f"❌ Initialization failed: {init_response.status}")
-                            return False
-                else:
-                    print(f"❌ Failed to connect to SSE endpoint: {response.status}")
-                    return False
+                async with session.post(self.messages_url, json=init_request) as init_response:
+                    if init_response.status == 200:
+                        result = await init_response.json()
+                        print(f"✅ Initialization successful: {result}")
+                        return True
+                    else:
+                        print(f"❌ Initialization failed: {init_response.status}")
+                        return False
+            else:
+                print(f"❌ Failed to connect to SSE endpoint: {response.status}")
+                return False
 
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
-        """Call a tool on the MCP server"""
-        async with aiohttp.ClientSession() as session:
-            request = {
-                "jsonrpc": "2.0",
-                "id": 2,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any], await_batch: bool = False):
+        """Call a tool on the MCP server
+        
+        With await_batch=True the call is queued and sent together with any other
+        calls queued in the same event loop tick as a single JSON-RPC batch. The
+        call then returns the server's response only if the batch is answered
+        inline. Over SSE the batch is just acknowledged and the replies arrive on
+        the SSE stream, which this client does not read, so it returns None.
+        It raises RuntimeError if the batch is rejected.
+        """
+        request = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
             }
-            
-            async with session.post(self.messages_url, json=request) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result
-                else:
-                    print(f"❌ Tool call failed: {response.status}")
-                    return None
+        }
+        
+        if await_batch:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending.append((request, future))
+            if len(self._pending) == 1:
+                task = loop.create_task(self._flush_pending())
+                self._flush_tasks.add(task)
+                task.add_done_callback(self._flush_tasks.discard)
+            return await future
+        
+        session = self._session
+        async with session.post(self.messages_url, json=request) as response:
+            if response.status == 200:
+                result = await response.json()
+                return result
+            else:
+                print(f"❌ Tool call failed: {response.status}")
+                return None
+
+    async def batch(self, requests: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+        """Send several JSON-RPC requests in one HTTP round trip
+        
+        Returns the list of responses when the server answers inline, or an empty
+        list when it only acknowledges the batch (replies then arrive over SSE).
+        """
+        session = self._session
+        async with session.post(self.messages_url, json=requests) as response:
+            if response.status in (200, 202):
+                if response.content_type == "application/json":
+                    return await response.json()
+                return []
+            else:
+                print(f"❌ Batch request failed: {response.status}")
+                return None
+
+    async def _flush_pending(self):
+        """Send all queued tool calls as one batch and resolve their futures"""
+        pending, self._pending = self._pending, []
+        try:
+            responses = await self.batch([request for request, _ in pending])
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        if responses is None:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(RuntimeError("Batch request failed"))
+            return
+        
+        responses_by_id = {response.get("id"): response for response in responses}
+        for request, future in pending:
+            if not future.done():
+                future.set_result(responses_by_id.get(request["id"]))
 
     async def list_tools(self):
         """List available tools"""
-        async with aiohttp.ClientSession() as session:
-            request = {
-                "jsonrpc": "2.0",
-                "id": 3,
-                "method": "tools/list",
-                "params": {}
-            }
+        session = self._session
+        request = {
+            "jsonrpc": "2.0",
+            "id": next(self._request_ids),
+            "method": "tools/list",
+            "params": {}
+        }
             
-            async with session.post(self.messages_url, json=request) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return result
-                else:
-                    print(f"❌ List tools failed: {response.status}")
-                    return None
+        async with session.post(self.messages_url, json=request) as response:
+            if response.status == 200:
+                result = await response.json()
+                return result
+            else:
+                print(f"❌ List tools failed: {response.status}")
+                return None
 
 async def test_server():
     """Test the HTTP MCP server"""
     print("🧪 Testing HTTP Text Classification MCP Server")
     print("=" * 50)
     
-    client = MCPHTTPClient("http://localhost:8000")
+    async with MCPHTTPClient("http://localhost:8000") as client:
+        # Test initialization
+        print("\n1. Testing initialization...")
+        if not await client.initialize():
+            print("❌ Server initialization failed")
+            return
     
-    # Test initialization
-    print("\n1. Testing initialization...")
-    if not await client.initialize():
-        print("❌ Server initialization failed")
-        return
+        # Test list tools
+        print("\n2. Testing list tools...")
+        tools_result = await client.list_tools()
+        if tools_result:
+            print(f"✅ Available tools: {json.dumps(tools_result, indent=2)}")
     
-    # Test list tools
-    print("\n2. Testing list tools...")
-    tools_result = await client.list_tools()
-    if tools_result:
-        print(f"✅ Available tools: {json.dumps(tools_result, indent=2)}")
+        # Test classification
+        print("\n3. Testing text classification...")
+        classification_result = await client.call_tool("classify_text", {
+            "text": "Apple announced new AI features in their latest iPhone",
+            "top_k": 3
+        })
+        if classification_result:
+            print(f"✅ Classification result: {json.dumps(classification_result, indent=2)}")
     
-    # Test classification
-    print("\n3. Testing text classification...")
-    classification_result = await client.call_tool("classify_text", {
-        "text": "Apple announced new AI features in their latest iPhone",
-        "top_k": 3
-    })
-    if classification_result:
-        print(f"✅ Classification result: {json.dumps(classification_result, indent=2)}")
+        # Test custom category
+        print("\n4. Testing add custom category...")
+        add_result = await client.call_tool("add_custom_category", {
+            "category_name": "automotive",
+            "description": "Cars, vehicles, automotive industry, transportation"
+        })
+        if add_result:
+            print(f"✅ Add category result: {json.dumps(add_result, indent=2)}")
     
-    # Test custom category
-    print("\n4. Testing add custom category...")
-    add_result = await client.call_tool("add_custom_category", {
-        "category_name": "automotive",
-        "description": "Cars, vehicles, automotive industry, transportation"
-    })
-    if add_result:
-        print(f"✅ Add category result: {json.dumps(add_result, indent=2)}")
+        # Test batched tool calls
+        print("\n5. Testing batched tool calls...")
+        try:
+            batch_results = await asyncio.gather(
+                client.call_tool("classify_text", {"text": "The team won the championship"}, await_batch=True),
+                client.call_tool("classify_text", {"text": "New vaccine shows promising results"}, await_batch=True)
+            )
+        except RuntimeError as e:
+            print(f"❌ Batched tool calls failed: {e}")
+        else:
+            if any(result is not None for result in batch_results):
+                print(f"✅ Batched results: {json.dumps(batch_results, indent=2)}")
+            else:
+                print("✅ Batch accepted; replies are delivered on the SSE stream")
     
-    print("\n✅ All tests completed!")
+        print("\n✅ All tests completed!")
 
 if __name__ == "__main__":
     asyncio.run(test_server())
\ No newline at end of file
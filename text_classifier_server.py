@@ -7,7 +7,7 @@
 #     "mcp[cli]>=1.9.4",
 #     "model2vec>=0.6.0",
 #     "numpy>=2.2.6",
-#     "scikit-learn>=1.7.0",
+#     "orjson>=3.10.18",
 # ]
 # ///
 """
@@ -22,14 +22,26 @@ uv run text_classifier_server.py
 """
 
 import asyncio
-import json
+import concurrent.futures
+import functools
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 
 import numpy as np
+import orjson
 from fastmcp import FastMCP
 from model2vec import StaticModel
-from sklearn.metrics.pairwise import cosine_similarity
+
+try:
+    # Optional: compiled classification kernels (pip install numba)
+    import numba
+except ImportError:
+    numba = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -38,27 +50,255 @@ logger = logging.getLogger(__name__)
 # Initialize FastMCP server
 mcp = FastMCP("text-classifier-server")
 
+# Model2Vec model used for all embeddings
+MODEL_NAME = "minishlab/potion-base-8M"
+
+# Category matrix, names and descriptions are persisted here so restarts do
+# not need to re-encode every category
+CATEGORY_CACHE_PATH = Path(__file__).with_name("categories_cache.npz")
+
 # Global variables for the model and categories
 model: Optional[StaticModel] = None
-categories: Dict[str, np.ndarray] = {}
+# Output dimension of the model, measured once by load_model
+EMBEDDING_DIM: Optional[int] = None
+# Category embeddings are kept L2-normalized and stacked in a single (N, D)
+# matrix whose rows line up with category_info, so cosine similarity against
+# every category is a single matrix-vector product
+category_matrix: Optional[np.ndarray] = None
+# (name, description) per matrix row, ready to drop into responses
+category_info: List[Tuple[str, str]] = []
 category_descriptions: Dict[str, str] = {}
 
+# Backing storage for category_matrix, which is a view of the first _cat_len
+# rows. Capacity doubles when full, so appends are amortized O(1).
+_cat_arena: Optional[np.ndarray] = None
+_cat_len = 0
+
+# Category state only changes under this lock. Appends write past the end of
+# existing views and removals replace the arrays and lists, so worker threads
+# can score against a snapshot without holding the lock. The version is
+# bumped on every change and keys the classification caches.
+_category_lock = threading.RLock()
+_category_version = 0
+
+# Serializes writes of the categories cache, which happen outside
+# _category_lock. Saves of a version that is already on disk are skipped, so
+# saves queued behind a write collapse into one.
+_save_lock = threading.Lock()
+_saved_version = -1
+
+# Maximum number of recent texts whose classification results are cached
+CLASSIFICATION_CACHE_SIZE = 4096
+
+# Upper bound on the page size of list_categories
+MAX_LIST_LIMIT = 1000
+
+# Text embeddings keyed on a hash of the text, in least-recently-used order.
+# Embeddings only depend on the text, so this survives category changes.
+EMBEDDING_CACHE_SIZE = 10_000
+embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+# Model inference and numpy scoring release the GIL, so CPU-bound tool work
+# runs on threads to keep the event loop free for concurrent requests
+THREAD_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, os.cpu_count() or 1))
+
+async def _run_in_pool(func, *args):
+    """Run a blocking function in THREAD_POOL and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(THREAD_POOL, functools.partial(func, *args))
+
+# Concurrent classify_text calls that miss the embedding cache are coalesced
+# into one model.encode call per window
+ENCODE_BATCH_WINDOW = 0.01  # seconds
+ENCODE_MAX_BATCH = 256
+
+# Set once the background load started by initialize_server has finished,
+# whether or not it succeeded
+model_ready = threading.Event()
+_model_loader: Optional[threading.Thread] = None
+
+async def _wait_until_ready():
+    """Wait for the background model and category load, if one was started"""
+    if _model_loader is not None and not model_ready.is_set():
+        await asyncio.to_thread(model_ready.wait)
+
+# Numba top-k kernel, built by load_model when numba is installed. It keeps a
+# heap of k entries, so it only beats argpartition for small k.
+_jit_top_k = None
+JIT_TOP_K_MAX = 32
+
 def load_model():
     """Load the Model2Vec static embedding model"""
-    global model
+    global model, EMBEDDING_DIM
     try:
         # Load a pre-trained Model2Vec model
         # Using the potion-base-8M model which is efficient and performant
-        model = StaticModel.from_pretrained("minishlab/potion-base-8M")
-        logger.info("Successfully loaded Model2Vec model: minishlab/potion-base-8M")
+        model = StaticModel.from_pretrained(MODEL_NAME)
+        EMBEDDING_DIM = model.encode(["x"])[0].shape[0]
+        logger.info(f"Successfully loaded Model2Vec model: {MODEL_NAME}")
     except Exception as e:
         logger.error(f"Failed to load Model2Vec model: {e}")
         raise
+    
+    if numba is not None:
+        try:
+            _build_jit_kernels()
+        except Exception as e:
+            # The kernel is only an accelerator; _top_k falls back to argpartition
+            logger.warning(f"Failed to compile numba kernels, using numpy: {e}")
+
+def _build_jit_kernels():
+    """Compile the heap-based top-k kernel"""
+    global _jit_top_k
+    
+    @numba.njit
+    def sift_down(scores, heap, j, size):
+        # Restore the min-heap property below heap[j], weakest score at the root
+        while True:
+            smallest = j
+            for child in (2 * j + 1, 2 * j + 2):
+                if child < size and scores[heap[child]] < scores[heap[smallest]]:
+                    smallest = child
+            if smallest == j:
+                return
+            heap[j], heap[smallest] = heap[smallest], heap[j]
+            j = smallest
+    
+    @numba.njit
+    def top_k(scores, k):
+        # Single pass over the scores with a k-entry heap, O(N log k)
+        heap = np.arange(k)
+        for j in range(k // 2 - 1, -1, -1):
+            sift_down(scores, heap, j, k)
+        for i in range(k, scores.shape[0]):
+            if scores[i] > scores[heap[0]]:
+                heap[0] = i
+                sift_down(scores, heap, 0, k)
+        # Best first
+        return heap[np.argsort(-scores[heap])]
+    
+    # Compile now rather than on the first request. Cached scores are
+    # read-only, which numba treats as a distinct signature.
+    scores = np.zeros(1, dtype=np.float32)
+    scores.setflags(write=False)
+    top_k(scores, 1)
+    
+    _jit_top_k = top_k
+    logger.info("Compiled numba top-k kernel")
+
+def _to_json(obj: Any) -> str:
+    """Serialize a tool result as compact JSON, accepting numpy scalars and arrays"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    """L2-normalize embeddings along the last axis, leaving zero vectors as-is"""
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.where(norms == 0, 1, norms)
+
+def _score(embeddings: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarities of text embeddings, shape (D,) or (M, D), against the category matrix"""
+    return _normalize(embeddings).astype(np.float32, copy=False) @ matrix.T
+
+def _embedding_key(text: str) -> bytes:
+    """Compact cache key for a text"""
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+def _encode_many_cached(texts: Sequence[str]) -> np.ndarray:
+    """Encode texts, reusing cached embeddings and encoding all misses in one call"""
+    keys = [_embedding_key(text) for text in texts]
+    
+    embeddings: Dict[bytes, np.ndarray] = {}
+    with _embedding_cache_lock:
+        for key in keys:
+            if key in embedding_cache:
+                embedding_cache.move_to_end(key)
+                embeddings[key] = embedding_cache[key]
+    
+    missing = {key: text for key, text in zip(keys, texts) if key not in embeddings}
+    if missing:
+        encoded = model.encode(list(missing.values()))
+        with _embedding_cache_lock:
+            for key, embedding in zip(missing, encoded):
+                # Copy so a cached row does not keep the whole batch alive
+                embedding = embedding.copy()
+                embedding.setflags(write=False)
+                embeddings[key] = embedding
+                embedding_cache[key] = embedding
+            while len(embedding_cache) > EMBEDDING_CACHE_SIZE:
+                embedding_cache.popitem(last=False)
+    
+    return np.stack([embeddings[key] for key in keys])
+
+def _encode_cached(text: str) -> np.ndarray:
+    """Encode a single text through the embedding cache"""
+    return _encode_many_cached([text])[0]
+
+class _EncodeBatcher:
+    """Micro-batcher that coalesces concurrent single-text encodes into one call"""
+    
+    def __init__(self, window: float, max_batch: int):
+        self.window = window
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    async def encode(self, text: str) -> np.ndarray:
+        """Queue a text for the next batch and wait for its embedding"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+        
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+    
+    async def _run(self):
+        while True:
+            pending = [await self._queue.get()]
+            
+            # Give concurrent requests one window to join the batch
+            await asyncio.sleep(self.window)
+            while len(pending) < self.max_batch and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            
+            pending = [(text, future) for text, future in pending if not future.done()]
+            if not pending:
+                continue
+            
+            # Encode texts of similar length together
+            pending.sort(key=lambda item: len(item[0]))
+            try:
+                embeddings = await _run_in_pool(_encode_many_cached, [text for text, _ in pending])
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(pending, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+_encode_batcher = _EncodeBatcher(ENCODE_BATCH_WINDOW, ENCODE_MAX_BATCH)
+
+def _top_k(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """Indices of the top_k highest scores along the last axis, best first"""
+    k = max(0, min(top_k, scores.shape[-1]))
+    if k == 0:
+        return np.empty(scores.shape[:-1] + (0,), dtype=np.intp)
+    
+    if _jit_top_k is not None and scores.ndim == 1 and k <= JIT_TOP_K_MAX:
+        return _jit_top_k(scores, k)
+    
+    # Partition in linear time, then sort only the selected entries
+    top_indices = np.argpartition(-scores, k - 1, axis=-1)[..., :k]
+    order = np.argsort(-np.take_along_axis(scores, top_indices, axis=-1), axis=-1)
+    return np.take_along_axis(top_indices, order, axis=-1)
 
 def setup_default_categories():
     """Setup default text classification categories with their embeddings"""
-    global categories, category_descriptions, model
-    
     if model is None:
         raise ValueError("Model not loaded")
     
@@ -76,72 +316,207 @@ def setup_default_categories():
         "food": "Food, cooking, restaurants, recipes, nutrition, culinary arts"
     }
     
-    # Generate embeddings for each category using their descriptions
-    for category, description in default_categories.items():
+    # Generate embeddings for all category descriptions in one call
+    try:
+        embeddings = model.encode(list(default_categories.values()))
+    except Exception as e:
+        logger.error(f"Failed to setup default categories: {e}")
+        return
+    
+    with _category_lock:
+        _reset_categories(_normalize(np.vstack(embeddings)), list(default_categories.items()))
+    for category in default_categories:
+        logger.info(f"Setup category: {category}")
+
+def save_categories():
+    """Persist the category matrix, names and descriptions to disk"""
+    global _saved_version
+    
+    with _save_lock:
+        with _category_lock:
+            matrix, info = category_matrix, list(category_info)
+            version = _category_version
+        if matrix is None or version == _saved_version:
+            return
+        
+        tmp_path = CATEGORY_CACHE_PATH.with_suffix(".tmp")
         try:
-            # Create embedding for the category description
-            embedding = model.encode([description])[0]
-            categories[category] = embedding
-            category_descriptions[category] = description
-            logger.info(f"Setup category: {category}")
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    matrix=matrix,
+                    names=np.array([name for name, _ in info], dtype=str),
+                    descriptions=np.array([description for _, description in info], dtype=str),
+                    model_id=MODEL_NAME
+                )
+            os.replace(tmp_path, CATEGORY_CACHE_PATH)
+            _saved_version = version
         except Exception as e:
-            logger.error(f"Failed to setup category {category}: {e}")
+            logger.warning(f"Failed to save categories to {CATEGORY_CACHE_PATH}: {e}")
+
+def load_categories() -> bool:
+    """
+    Load categories persisted by save_categories.
+    
+    Returns:
+        True if categories were loaded, False if there is no usable cache
+    """
+    if not CATEGORY_CACHE_PATH.exists():
+        return False
+    
+    try:
+        with np.load(CATEGORY_CACHE_PATH) as data:
+            if str(data["model_id"]) != MODEL_NAME:
+                logger.info(f"Ignoring categories cache built with model {data['model_id']}")
+                return False
+            matrix = data["matrix"]
+            names = data["names"].tolist()
+            descriptions = data["descriptions"].tolist()
+    except Exception as e:
+        logger.warning(f"Failed to load categories from {CATEGORY_CACHE_PATH}: {e}")
+        return False
+    
+    with _category_lock:
+        _reset_categories(matrix, list(zip(names, descriptions)))
+    logger.info(f"Loaded {len(names)} categories from {CATEGORY_CACHE_PATH}")
+    return True
+
+def _reset_categories(matrix: np.ndarray, info: List[Tuple[str, str]]):
+    """Replace all categories with normalized rows and their info; caller holds _category_lock"""
+    global _cat_arena, _cat_len, category_info, category_descriptions
+    
+    _cat_arena = np.ascontiguousarray(matrix, dtype=np.float32)
+    _cat_len = len(info)
+    category_info = list(info)
+    category_descriptions = dict(category_info)
+    _publish_categories()
+
+def _publish_categories():
+    """Point category_matrix at the filled rows of the arena; caller holds _category_lock"""
+    global category_matrix
+    
+    category_matrix = _cat_arena[:_cat_len]
+    _invalidate_classification_cache()
+
+def _append_category(category_name: str, description: str, embedding: np.ndarray):
+    """Append a category embedding as a new row of the category matrix; caller holds _category_lock"""
+    global _cat_arena, _cat_len
+    
+    row = _normalize(embedding)
+    if _cat_arena is None or _cat_len == len(_cat_arena):
+        # Grow into a new arena; existing snapshots keep the old one
+        capacity = max(1, 2 * _cat_len)
+        arena = np.empty((capacity, row.shape[0]), dtype=np.float32)
+        if _cat_arena is not None:
+            arena[:_cat_len] = _cat_arena[:_cat_len]
+        _cat_arena = arena
+    
+    _cat_arena[_cat_len] = row
+    _cat_len += 1
+    category_info.append((category_name, description))
+    category_descriptions[category_name] = description
+    _publish_categories()
+
+def _remove_category(category_name: str):
+    """Remove a category and its row from the category matrix; caller holds _category_lock"""
+    index = [name for name, _ in category_info].index(category_name)
+    _reset_categories(
+        np.delete(category_matrix, index, axis=0),
+        category_info[:index] + category_info[index + 1:]
+    )
+
+def _category_snapshot():
+    """Consistent (matrix, info) view of the current categories"""
+    with _category_lock:
+        return category_matrix, category_info
+
+@functools.lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _text_scores(text: str, version: int):
+    """Category snapshot and the text's similarity to each category, cached per (text, category version)"""
+    matrix, info = _category_snapshot()
+    scores = _score(_encode_cached(text), matrix)
+    scores.setflags(write=False)
+    return info, scores
+
+@functools.lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_text_cached(text: str, top_k: int, scores_mode: str, version: int) -> str:
+    """Build the classify_text JSON response, cached per (text, top_k, scores_mode, category version)"""
+    info, scores = _text_scores(text, version)
+    
+    # Format results
+    predictions = []
+    for i in _top_k(scores, top_k):
+        name, description = info[i]
+        prediction = {"category": name}
+        if scores_mode != "none":
+            prediction["confidence"] = scores[i]
+        prediction["description"] = description
+        predictions.append(prediction)
+    
+    results = {
+        "text": text,
+        "predictions": predictions
+    }
+    if scores_mode == "all":
+        results["all_scores"] = {
+            category: score
+            for (category, _), score in zip(info, scores)
+        }
+    
+    return _to_json(results)
+
+def _invalidate_classification_cache():
+    """Start a new category version and drop cached results; caller holds _category_lock"""
+    global _category_version
+    _category_version += 1
+    _text_scores.cache_clear()
+    _classify_text_cached.cache_clear()
+
+def _classify_text(text: str, top_k: int, scores: str) -> str:
+    """Blocking implementation of classify_text"""
+    if model is None:
+        return _to_json({"error": "Model not loaded"})
+    
+    if not category_info:
+        return _to_json({"error": "No categories defined"})
+    
+    try:
+        return _classify_text_cached(text, top_k, scores, _category_version)
+        
+    except Exception as e:
+        logger.error(f"Classification error: {e}")
+        return _to_json({"error": f"Classification failed: {str(e)}"})
 
 @mcp.tool()
-def classify_text(text: str, top_k: int = 3) -> str:
+async def classify_text(
+    text: str,
+    top_k: int = 3,
+    scores: Literal["none", "topk", "all"] = "topk"
+) -> str:
     """
     Classify text into predefined categories using static embeddings.
     
     Args:
         text: The text to classify
         top_k: Number of top categories to return (default: 3)
+        scores: Which scores to include: "none", confidences for the top
+                categories only ("topk", default), or also every category's
+                score under "all_scores" ("all")
     
     Returns:
         JSON string with classification results
     """
-    if model is None:
-        return json.dumps({"error": "Model not loaded"})
+    await _wait_until_ready()
     
-    if not categories:
-        return json.dumps({"error": "No categories defined"})
+    # Embed through the micro-batcher so the blocking path hits the embedding cache
+    if model is not None and _embedding_key(text) not in embedding_cache:
+        try:
+            await _encode_batcher.encode(text)
+        except Exception as e:
+            logger.error(f"Classification error: {e}")
+            return _to_json({"error": f"Classification failed: {str(e)}"})
     
-    try:
-        # Generate embedding for the input text
-        text_embedding = model.encode([text])[0]
-        
-        # Calculate similarities with all categories
-        similarities = {}
-        for category, category_embedding in categories.items():
-            # Reshape for cosine similarity calculation
-            text_emb = text_embedding.reshape(1, -1)
-            cat_emb = category_embedding.reshape(1, -1)
-            
-            similarity = cosine_similarity(text_emb, cat_emb)[0][0]
-            similarities[category] = float(similarity)
-        
-        # Sort by similarity and get top_k results
-        sorted_categories = sorted(similarities.items(), key=lambda x: x[1], reverse=True)
-        top_categories = sorted_categories[:top_k]
-        
-        # Format results
-        results = {
-            "text": text,
-            "predictions": [
-                {
-                    "category": category,
-                    "confidence": round(similarity, 4),
-                    "description": category_descriptions.get(category, "")
-                }
-                for category, similarity in top_categories
-            ],
-            "all_scores": similarities
-        }
-        
-        return json.dumps(results, indent=2)
-        
-    except Exception as e:
-        logger.error(f"Classification error: {e}")
-        return json.dumps({"error": f"Classification failed: {str(e)}"})
+    return await _run_in_pool(_classify_text, text, top_k, scores)
 
 def _add_single_category(category_name: str, description: str) -> Dict[str, Any]:
     """
@@ -161,24 +536,30 @@ def _add_single_category(category_name: str, description: str) -> Dict[str, Any]
         category_lower = category_name.lower()
         
         # Check if category already exists
-        if category_lower in categories:
+        if category_lower in category_descriptions:
             return {
                 "success": False,
                 "error": f"Category '{category_name}' already exists"
             }
         
         # Generate embedding for the category description
-        embedding = model.encode([description])[0]
+        embedding = _encode_cached(description)
         
-        # Add to categories
-        categories[category_lower] = embedding
-        category_descriptions[category_lower] = description
+        # Add to categories, re-checking in case it was added concurrently
+        with _category_lock:
+            if category_lower in category_descriptions:
+                return {
+                    "success": False,
+                    "error": f"Category '{category_name}' already exists"
+                }
+            _append_category(category_lower, description, embedding)
+            total_categories = len(category_info)
         
         logger.info(f"Added custom category: {category_name}")
         return {
             "success": True,
             "message": f"Added category '{category_name}' successfully",
-            "total_categories": len(categories)
+            "total_categories": total_categories
         }
         
     except Exception as e:
@@ -188,8 +569,15 @@ def _add_single_category(category_name: str, description: str) -> Dict[str, Any]
             "error": f"Failed to add category: {str(e)}"
         }
 
+def _add_custom_category(category_name: str, description: str) -> str:
+    """Blocking implementation of add_custom_category"""
+    result = _add_single_category(category_name, description)
+    if result.get("success"):
+        save_categories()
+    return _to_json(result)
+
 @mcp.tool()
-def add_custom_category(category_name: str, description: str) -> str:
+async def add_custom_category(category_name: str, description: str) -> str:
     """
     Add a new custom category for classification.
     
@@ -200,21 +588,11 @@ def add_custom_category(category_name: str, description: str) -> str:
     Returns:
         JSON string with operation result
     """
-    result = _add_single_category(category_name, description)
-    return json.dumps(result, indent=2)
+    await _wait_until_ready()
+    return await _run_in_pool(_add_custom_category, category_name, description)
 
-@mcp.tool()
-def batch_add_custom_categories(categories_data: List[Dict[str, str]]) -> str:
-    """
-    Add multiple custom categories for classification in a single operation.
-    
-    Args:
-        categories_data: List of dictionaries with 'name' and 'description' keys
-                        Example: [{"name": "music", "description": "Music, songs, artists, albums"}]
-    
-    Returns:
-        JSON string with batch operation results
-    """
+def _batch_add_custom_categories(categories_data: List[Dict[str, str]]) -> str:
+    """Blocking implementation of batch_add_custom_categories"""
     try:
         results = []
         added_count = 0
@@ -257,184 +635,230 @@ def batch_add_custom_categories(categories_data: List[Dict[str, str]]) -> str:
                         "message": error_msg
                     })
         
-        return json.dumps({
+        if added_count:
+            save_categories()
+        
+        return _to_json({
             "operation": "batch_add_custom_categories",
             "total_requested": len(categories_data),
             "added_count": added_count,
-            "total_categories": len(categories),
+            "total_categories": len(category_info),
             "results": results
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Batch add categories error: {e}")
-        return json.dumps({
+        return _to_json({
             "operation": "batch_add_custom_categories",
             "error": f"Batch operation failed: {str(e)}"
         })
 
 @mcp.tool()
-def list_categories() -> str:
+async def batch_add_custom_categories(categories_data: List[Dict[str, str]]) -> str:
     """
-    List all available categories for classification.
+    Add multiple custom categories for classification in a single operation.
+    
+    Args:
+        categories_data: List of dictionaries with 'name' and 'description' keys
+                        Example: [{"name": "music", "description": "Music, songs, artists, albums"}]
     
     Returns:
-        JSON string with all categories and their descriptions
+        JSON string with batch operation results
+    """
+    await _wait_until_ready()
+    return await _run_in_pool(_batch_add_custom_categories, categories_data)
+
+@mcp.tool()
+async def list_categories(offset: int = 0, limit: int = 100) -> str:
+    """
+    List available categories for classification, one page at a time.
+    
+    Args:
+        offset: Index of the first category to return (default: 0)
+        limit: Maximum number of categories to return (default: 100, min: 1, max: 1000)
+    
+    Returns:
+        JSON string with a page of categories and their descriptions
     """
+    await _wait_until_ready()
+    _, info = _category_snapshot()
+    offset = max(0, offset)
+    limit = max(1, min(limit, MAX_LIST_LIMIT))
+    page = info[offset:offset + limit]
+    
     result = {
-        "total_categories": len(categories),
+        "total_categories": len(info),
+        "offset": offset,
+        "limit": limit,
         "categories": [
             {
                 "name": category,
                 "description": description
             }
-            for category, description in category_descriptions.items()
+            for category, description in page
         ]
     }
+    if offset + len(page) < len(info):
+        result["next_offset"] = offset + len(page)
     
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
-@mcp.tool()
-def remove_categories(category_names: List[str]) -> str:
-    """
-    Remove one or multiple categories from the classification system.
-    
-    Args:
-        category_names: List of category names to remove
-    
-    Returns:
-        JSON string with removal results for each category
-    """
+def _remove_categories(category_names: List[str]) -> str:
+    """Blocking implementation of remove_categories"""
     try:
         results = []
         removed_count = 0
         
-        for category_name in category_names:
-            category_lower = category_name.lower()
+        with _category_lock:
+            for category_name in category_names:
+                category_lower = category_name.lower()
+                
+                if category_lower in category_descriptions:
+                    _remove_category(category_lower)
+                    results.append({
+                        "category": category_name,
+                        "status": "removed",
+                        "message": f"Category '{category_name}' removed successfully"
+                    })
+                    removed_count += 1
+                    logger.info(f"Removed category: {category_name}")
+                else:
+                    results.append({
+                        "category": category_name,
+                        "status": "not_found",
+                        "message": f"Category '{category_name}' not found"
+                    })
             
-            if category_lower in categories:
-                # Remove from both dictionaries
-                del categories[category_lower]
-                del category_descriptions[category_lower]
-                results.append({
-                    "category": category_name,
-                    "status": "removed",
-                    "message": f"Category '{category_name}' removed successfully"
-                })
-                removed_count += 1
-                logger.info(f"Removed category: {category_name}")
-            else:
-                results.append({
-                    "category": category_name,
-                    "status": "not_found",
-                    "message": f"Category '{category_name}' not found"
-                })
+            remaining_categories = len(category_descriptions)
+        
+        if removed_count:
+            save_categories()
         
-        return json.dumps({
+        return _to_json({
             "operation": "remove_categories",
             "total_requested": len(category_names),
             "removed_count": removed_count,
-            "remaining_categories": len(categories),
+            "remaining_categories": remaining_categories,
             "results": results
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Failed to remove categories: {e}")
-        return json.dumps({
+        return _to_json({
             "operation": "remove_categories",
             "error": f"Failed to remove categories: {str(e)}"
         })
 
 @mcp.tool()
-def batch_classify(texts: List[str], top_k: int = 1) -> str:
+async def remove_categories(category_names: List[str]) -> str:
     """
-    Classify multiple texts at once.
+    Remove one or multiple categories from the classification system.
     
     Args:
-        texts: List of texts to classify
-        top_k: Number of top categories to return for each text
+        category_names: List of category names to remove
     
     Returns:
-        JSON string with batch classification results
+        JSON string with removal results for each category
     """
+    await _wait_until_ready()
+    return await _run_in_pool(_remove_categories, category_names)
+
+def _batch_classify(texts: List[str], top_k: int) -> str:
+    """Blocking implementation of batch_classify"""
     if model is None:
-        return json.dumps({"error": "Model not loaded"})
+        return _to_json({"error": "Model not loaded"})
     
-    if not categories:
-        return json.dumps({"error": "No categories defined"})
+    if not category_info:
+        return _to_json({"error": "No categories defined"})
     
     try:
         results = []
         
-        for i, text in enumerate(texts):
-            # Generate embedding for the input text
-            text_embedding = model.encode([text])[0]
+        if texts:
+            # Generate embeddings for all input texts in one call
+            text_embeddings = _encode_many_cached(texts)
             
-            # Calculate similarities with all categories
-            similarities = {}
-            for category, category_embedding in categories.items():
-                text_emb = text_embedding.reshape(1, -1)
-                cat_emb = category_embedding.reshape(1, -1)
-                similarity = cosine_similarity(text_emb, cat_emb)[0][0]
-                similarities[category] = float(similarity)
+            # Cosine similarities for every (text, category) pair, shape (texts, categories)
+            matrix, info = _category_snapshot()
+            scores = _score(text_embeddings, matrix)
             
-            # Sort by similarity and get top_k results
-            sorted_categories = sorted(similarities.items(), key=lambda x: x[1], reverse=True)
-            top_categories = sorted_categories[:top_k]
+            # Select the top_k categories per text
+            top_indices = _top_k(scores, top_k)
+            top_scores = np.take_along_axis(scores, top_indices, axis=1)
             
-            results.append({
-                "index": i,
-                "text": text,
-                "predictions": [
-                    {
-                        "category": category,
-                        "confidence": round(similarity, 4)
-                    }
-                    for category, similarity in top_categories
-                ]
-            })
+            for i, text in enumerate(texts):
+                results.append({
+                    "index": i,
+                    "text": text,
+                    "predictions": [
+                        {
+                            "category": info[j][0],
+                            "confidence": score
+                        }
+                        for j, score in zip(top_indices[i], top_scores[i])
+                    ]
+                })
         
-        return json.dumps({
+        return _to_json({
             "batch_size": len(texts),
             "results": results
-        }, indent=2)
+        })
         
     except Exception as e:
         logger.error(f"Batch classification error: {e}")
-        return json.dumps({"error": f"Batch classification failed: {str(e)}"})
+        return _to_json({"error": f"Batch classification failed: {str(e)}"})
+
+@mcp.tool()
+async def batch_classify(texts: List[str], top_k: int = 1) -> str:
+    """
+    Classify multiple texts at once.
+    
+    Args:
+        texts: List of texts to classify
+        top_k: Number of top categories to return for each text
+    
+    Returns:
+        JSON string with batch classification results
+    """
+    await _wait_until_ready()
+    return await _run_in_pool(_batch_classify, texts, top_k)
 
 @mcp.resource("categories://list")
-def get_categories_resource() -> str:
+async def get_categories_resource() -> str:
     """Resource that provides the list of available categories"""
-    return json.dumps({
+    await _wait_until_ready()
+    return _to_json({
         "resource_type": "categories",
         "description": "Available text classification categories",
-        "categories": list(category_descriptions.keys()),
-        "total": len(categories)
-    }, indent=2)
+        "categories": [name for name, _ in _category_snapshot()[1]],
+        "total": len(category_info)
+    })
 
 @mcp.resource("model://info")
-def get_model_info() -> str:
+async def get_model_info() -> str:
     """Resource that provides information about the loaded model"""
+    await _wait_until_ready()
     if model is None:
-        return json.dumps({"error": "Model not loaded"})
+        return _to_json({"error": "Model not loaded"})
     
-    return json.dumps({
+    return _to_json({
         "resource_type": "model_info",
-        "model_name": "minishlab/potion-base-8M",
+        "model_name": MODEL_NAME,
         "model_type": "Model2Vec Static Embeddings",
         "description": "Fast static embedding model for text classification",
-        "embedding_dimension": len(model.encode(["test"])[0]) if model else "unknown",
-        "categories_loaded": len(categories)
-    }, indent=2)
+        "embedding_dimension": EMBEDDING_DIM if EMBEDDING_DIM is not None else "unknown",
+        "categories_loaded": len(category_info)
+    })
 
 @mcp.prompt()
-def classification_prompt(text: str) -> str:
+async def classification_prompt(text: str) -> str:
     """
     Prompt template for text classification.
     
     Args:
         text: The text to classify
     """
+    await _wait_until_ready()
     return f"""Please classify the following text using the available categories:
 
 Text: "{text}"
@@ -444,27 +868,49 @@ Use the classify_text tool to analyze this text and provide:
 2. Confidence scores for top categories
 3. Brief explanation of why this classification makes sense
 
-Available categories: {', '.join(category_descriptions.keys())}"""
+Available categories: {', '.join(name for name, _ in _category_snapshot()[1])}"""
 
-def initialize_server():
-    """Initialize the MCP server with model and categories"""
-    logger.info("Initializing Text Classification MCP Server...")
-    
+def _load_model_and_categories():
+    """Load the model and categories; runs on the background loader thread"""
     try:
         # Load the Model2Vec model
         load_model()
         
-        # Setup default categories
-        setup_default_categories()
+        # Restore persisted categories, or setup and persist the defaults
+        if not load_categories():
+            setup_default_categories()
+            save_categories()
         
-        logger.info(f"Server initialized with {len(categories)} categories")
-        logger.info("Available tools: classify_text, add_custom_category, batch_add_custom_categories, list_categories, remove_categories, batch_classify")
-        logger.info("Available resources: categories://list, model://info")
-        logger.info("Available prompts: classification_prompt")
+        logger.info(f"Server initialized with {len(category_info)} categories")
         
     except Exception as e:
         logger.error(f"Failed to initialize server: {e}")
-        raise
+        # Exit non-zero, as a failed synchronous startup did, so Docker or
+        # systemd restart the server instead of it answering "Model not
+        # loaded" forever. Nothing else can stop the transport from here.
+        os._exit(1)
+        
+    finally:
+        model_ready.set()
+
+def initialize_server():
+    """
+    Initialize the MCP server with model and categories.
+    
+    The model is loaded on a background thread so the transport can start
+    accepting connections immediately; tools wait for it before running. If
+    the load fails the process exits with status 1.
+    """
+    global _model_loader
+    logger.info("Initializing Text Classification MCP Server...")
+    
+    model_ready.clear()
+    _model_loader = threading.Thread(target=_load_model_and_categories, name="model-loader", daemon=True)
+    _model_loader.start()
+    
+    logger.info("Available tools: classify_text, add_custom_category, batch_add_custom_categories, list_categories, remove_categories, batch_classify")
+    logger.info("Available resources: categories://list, model://info")
+    logger.info("Available prompts: classification_prompt")
 
 def main():
     """Main function to run the MCP server"""